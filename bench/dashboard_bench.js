@@ -0,0 +1,161 @@
+/**
+ * Browser-free benchmark of the dashboard's per-frame and per-render work.
+ *
+ * Each simulated render receives `full` full-snapshot metrics frames,
+ * `partial` small partial frames (as sent for spikes) and one partial alarm
+ * frame with the status changes of one load generator tick, all as JSON text
+ * in the server's wire format, then applies them the way renderFrame() does.
+ *
+ * Usage: node bench/dashboard_bench.js [series] [full] [partial] [renders]
+ */
+const {
+    FrameBuffer,
+    SeriesStore,
+    HistoryRing,
+    visibleRange,
+    decimateMinMax
+} = require('../static/js/dashboard-state.js');
+
+function intArg(position, fallback) {
+    const value = parseInt(process.argv[position], 10);
+    return Number.isNaN(value) ? fallback : value;
+}
+
+const SERIES = intArg(2, 10000);
+const FULL_FRAMES = intArg(3, 1);
+const PARTIAL_FRAMES = intArg(4, 3);
+const RENDERS = Math.max(1, intArg(5, 100));
+const PARTIAL_SIZE = 10;
+// About 2% of load generator series change status per tick at the defaults
+const ALARM_CHANGES = Math.max(1, Math.round(SERIES * 0.02));
+const HISTORY_LENGTH = 50;
+const TYPES = ['cpu', 'memory', 'bandwidth', 'latency'];
+const LEVELS = ['normal', 'warning', 'critical'];
+
+// Deterministic pseudo-random numbers so runs are comparable
+let state = 42;
+function random() {
+    state = (state * 1664525 + 1013904223) >>> 0;
+    return state / 4294967296;
+}
+
+const names = [];
+for (let i = 0; i < SERIES; i++) {
+    names.push(`${TYPES[i % TYPES.length]}-${String(i).padStart(6, '0')}`);
+}
+
+function metricsMessage(full) {
+    const data = {};
+    const count = full ? SERIES : PARTIAL_SIZE;
+    for (let i = 0; i < count; i++) {
+        const name = full ? names[i] : names[Math.floor(random() * SERIES)];
+        data[name] = { value: Math.round(random() * 100000) / 1000, unit: '%' };
+    }
+    return JSON.stringify({ type: 'metrics_update', full, data });
+}
+
+function alarmEntry(name, status) {
+    return {
+        status,
+        last_triggered: '2026-01-01T00:00:00.000000',
+        value: random() * 100,
+        unit: '%'
+    };
+}
+
+function alarmMessage() {
+    const status = {};
+    for (let i = 0; i < ALARM_CHANGES; i++) {
+        const name = names[Math.floor(random() * SERIES)];
+        status[name] = alarmEntry(name, LEVELS[Math.floor(random() * LEVELS.length)]);
+    }
+    const history = [];
+    for (let i = 0; i < HISTORY_LENGTH; i++) {
+        const entry = alarmEntry(names[i % SERIES], 'critical');
+        history.push({
+            metric: names[i % SERIES],
+            status: entry.status,
+            value: entry.value,
+            unit: entry.unit,
+            timestamp: entry.last_triggered,
+            message: `${names[i % SERIES].toUpperCase()} critical: ${entry.value}%`
+        });
+    }
+    return JSON.stringify({ type: 'alarm_update', full: false, status, history });
+}
+
+// Partial frames are interleaved with full ones so both buffer paths run
+const metricMessages = [];
+for (let i = 0; i < Math.max(FULL_FRAMES, PARTIAL_FRAMES); i++) {
+    if (i < FULL_FRAMES) metricMessages.push(metricsMessage(true));
+    if (i < PARTIAL_FRAMES) metricMessages.push(metricsMessage(false));
+}
+const alarmText = alarmMessage();
+
+const buffer = new FrameBuffer();
+const store = new SeriesStore();
+const history = new HistoryRing(3600);
+for (let i = 0; i < 3600; i++) history.push(random() * 100);
+const selected = names[0];
+
+const timings = {};
+const renderLabels = new Set();
+function timed(label, fn, inRender = false) {
+    if (inRender) renderLabels.add(label);
+    const start = process.hrtime.bigint();
+    const result = fn();
+    timings[label] = (timings[label] || 0) + Number(process.hrtime.bigint() - start) / 1e6;
+    return result;
+}
+
+function render() {
+    // Arrival: what handleMessage() does for each frame
+    for (const text of metricMessages) {
+        const message = timed('parse metrics frames', () => JSON.parse(text));
+        timed('record history + buffer metrics', () => {
+            const data = message.data[selected];
+            if (data) history.push(data.value);
+            buffer.pushMetrics(message.data, message.full);
+        });
+    }
+    const alarm = timed('parse alarm frame', () => JSON.parse(alarmText));
+    buffer.pushAlarm(alarm.status, alarm.history, alarm.full);
+
+    // Render: what renderFrame() does once per animation frame
+    const pending = buffer.drain();
+    timed('apply metrics frames to store', () => {
+        for (const metrics of pending.metricFrames) store.applyMetrics(metrics);
+    }, true);
+    timed('apply alarm status to store', () => {
+        for (const frame of pending.alarmFrames) store.applyAlarms(frame.status, frame.full);
+    }, true);
+    timed('per-type card summary', () => store.summarizeTypes(), true);
+    timed('highest severity + 10 active alarms', () => {
+        store.highestSeverity();
+        store.activeAlarms(10);
+    }, true);
+    timed('visible range (300px viewport)', () => {
+        visibleRange(random() * SERIES * 28, 300, 28, store.size);
+    }, true);
+    timed('decimate 3600 samples to 800 columns', () => decimateMinMax(history.toArray(), 800), true);
+}
+
+render();  // warm up
+for (const label in timings) timings[label] = 0;
+for (let i = 0; i < RENDERS; i++) render();
+
+console.log(`${SERIES} series; per render: ${FULL_FRAMES} full + ${PARTIAL_FRAMES} partial ` +
+            `metrics frames and 1 alarm frame (${ALARM_CHANGES} changes); ${RENDERS} renders\n`);
+
+let total = 0;
+let renderTotal = 0;
+for (const [label, ms] of Object.entries(timings)) {
+    const perRender = ms / RENDERS;
+    total += perRender;
+    if (renderLabels.has(label)) renderTotal += perRender;
+    console.log(`${label.padEnd(40)} ${perRender.toFixed(3).padStart(9)} ms`);
+}
+
+console.log(`\nmain-thread total per render: ${total.toFixed(3)} ms ` +
+            `(${total <= 16.7 ? 'within' : 'exceeds'} the 16.7 ms frame budget)`);
+console.log(`  of which in renderFrame():     ${renderTotal.toFixed(3)} ms`);
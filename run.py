@@ -2,6 +2,7 @@
 """
 Main entry point for the Smart Threshold Crossing Alarm application.
 """
+import argparse
 import sys
 from twisted.internet import reactor
 from twisted.python import log
@@ -10,15 +11,90 @@ from threshold_alarm.web import create_web_server
 from threshold_alarm.metrics import MetricsFactory
 from threshold_alarm.alarm import AlarmManager
 from threshold_alarm.threshold import ThresholdManager
+from threshold_alarm.config import (
+    LOADGEN_RATE,
+    LOADGEN_SPIKE_PROBABILITY,
+    LOADGEN_FLAP_PROBABILITY,
+    LOADGEN_DIURNAL_PERIOD,
+)
+
+# Load generator options and their defaults. They are parsed with a default
+# of None so that passing one without --series can be reported.
+LOADGEN_DEFAULTS = {
+    "rate": LOADGEN_RATE,
+    "seed": None,
+    "spike_probability": LOADGEN_SPIKE_PROBABILITY,
+    "flap_probability": LOADGEN_FLAP_PROBABILITY,
+    "diurnal_period": LOADGEN_DIURNAL_PERIOD,
+}
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Smart Threshold Crossing Alarm")
+    parser.add_argument("--series", type=int, default=0,
+                        help="run the vectorized load generator with this many series "
+                             "(default: the built-in four-metric simulator)")
+    parser.add_argument("--rate", type=float,
+                        help=f"load generator ticks per second (default: {LOADGEN_RATE})")
+    parser.add_argument("--seed", type=int,
+                        help="load generator random seed, for reproducible runs")
+    parser.add_argument("--spike-probability", type=float,
+                        help="per-series, per-tick probability of a spike "
+                             f"(default: {LOADGEN_SPIKE_PROBABILITY})")
+    parser.add_argument("--flap-probability", type=float,
+                        help="per-series, per-tick probability of a status flap "
+                             f"(default: {LOADGEN_FLAP_PROBABILITY})")
+    parser.add_argument("--diurnal-period", type=float,
+                        help="length of the simulated daily cycle in seconds "
+                             f"(default: {LOADGEN_DIURNAL_PERIOD})")
+    args = parser.parse_args(argv)
+
+    if args.series < 0:
+        parser.error("--series must not be negative")
+
+    given = [option for option in LOADGEN_DEFAULTS if getattr(args, option) is not None]
+    if given and args.series == 0:
+        options = ", ".join(f"--{option.replace('_', '-')}" for option in given)
+        parser.error(f"{options} only affect the load generator and require --series")
+
+    for option, default in LOADGEN_DEFAULTS.items():
+        if getattr(args, option) is None:
+            setattr(args, option, default)
+
+    if args.rate <= 0:
+        parser.error("--rate must be positive")
+    if args.diurnal_period <= 0:
+        parser.error("--diurnal-period must be positive")
+    for option in ("spike_probability", "flap_probability"):
+        if not 0 <= getattr(args, option) <= 1:
+            parser.error(f"--{option.replace('_', '-')} must be between 0 and 1")
+
+    return args
 
 def main():
+    args = parse_args()
+
     # Set up logging
     log.startLogging(sys.stdout)
     
     # Create core components
     threshold_manager = ThresholdManager()
     alarm_manager = AlarmManager(threshold_manager)
-    metrics_factory = MetricsFactory(threshold_manager, alarm_manager)
+    if args.series > 0:
+        # Imported here because NumPy is an optional dependency, only
+        # needed for load generation
+        from threshold_alarm.loadgen import LoadGeneratorFactory
+        metrics_factory = LoadGeneratorFactory(
+            threshold_manager,
+            alarm_manager,
+            args.series,
+            rate=args.rate,
+            seed=args.seed,
+            spike_probability=args.spike_probability,
+            flap_probability=args.flap_probability,
+            diurnal_period=args.diurnal_period,
+        )
+    else:
+        metrics_factory = MetricsFactory(threshold_manager, alarm_manager)
     
     # Start the metrics simulation
     metrics_factory.start_simulation()
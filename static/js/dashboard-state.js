@@ -0,0 +1,367 @@
+/**
+ * DOM-free state handling for the dashboard.
+ *
+ * Incoming WebSocket frames are collected in a FrameBuffer and applied to a
+ * SeriesStore once per animation frame. Nothing in this file touches the DOM,
+ * so it also loads under Node for bench/dashboard_bench.js.
+ */
+(function (root, factory) {
+    if (typeof module === 'object' && module.exports) {
+        module.exports = factory();
+    } else {
+        root.DashboardState = factory();
+    }
+}(typeof self !== 'undefined' ? self : this, function () {
+    const STATUS_LEVELS = ['normal', 'warning', 'critical'];
+    const STATUS_CODES = { normal: 0, warning: 1, critical: 2 };
+
+    /**
+     * Metric type of a series: "cpu-000042" and "cpu" are both "cpu"
+     */
+    function metricType(name) {
+        return name.replace(/-\d+$/, '');
+    }
+
+    /**
+     * Accumulates frames between renders, keeping only the latest state.
+     *
+     * Metrics and alarm frames are kept in arrival order so they can be
+     * applied to a SeriesStore without copying. A frame the server marks as
+     * full replaces everything pending of its kind.
+     */
+    class FrameBuffer {
+        constructor() {
+            this.metricFrames = [];
+            this.alarmFrames = [];
+            this.history = null;
+        }
+
+        /**
+         * Queue a metrics_update payload
+         */
+        pushMetrics(data, full) {
+            if (full) {
+                this.metricFrames = [data];
+            } else {
+                this.metricFrames.push(data);
+            }
+        }
+
+        /**
+         * Queue an alarm_update payload; only the latest history is kept
+         */
+        pushAlarm(status, history, full) {
+            const frame = { status: status || {}, full: Boolean(full) };
+            if (full) {
+                this.alarmFrames = [frame];
+            } else {
+                this.alarmFrames.push(frame);
+            }
+            this.history = history || [];
+        }
+
+        isEmpty() {
+            return this.metricFrames.length === 0 && this.alarmFrames.length === 0;
+        }
+
+        /**
+         * Return the pending state and reset the buffer
+         */
+        drain() {
+            const pending = {
+                metricFrames: this.metricFrames,
+                alarmFrames: this.alarmFrames,
+                history: this.history
+            };
+            this.metricFrames = [];
+            this.alarmFrames = [];
+            this.history = null;
+            return pending;
+        }
+    }
+
+    /**
+     * Latest value, unit and alarm status for every series that has data.
+     *
+     * Values and statuses live in typed arrays indexed by insertion order so
+     * the virtualized list can read any row without walking an object.
+     * Alarm statuses for series that have not reported a value yet are held
+     * back until they do.
+     */
+    class SeriesStore {
+        constructor(capacity = 1024) {
+            this.names = [];
+            this.units = [];
+            this.index = new Map();
+            this.values = new Float64Array(capacity);
+            this.statuses = new Uint8Array(capacity);
+            this.types = new Uint16Array(capacity);
+            this.typeNames = [];
+            this.typeIds = new Map();
+            this.pendingStatuses = new Map();
+            this.warningCount = 0;
+            this.criticalCount = 0;
+        }
+
+        get size() {
+            return this.names.length;
+        }
+
+        _grow(required) {
+            let capacity = this.values.length;
+            if (required <= capacity) return;
+            while (capacity < required) capacity *= 2;
+
+            const values = new Float64Array(capacity);
+            values.set(this.values);
+            this.values = values;
+
+            const statuses = new Uint8Array(capacity);
+            statuses.set(this.statuses);
+            this.statuses = statuses;
+
+            const types = new Uint16Array(capacity);
+            types.set(this.types);
+            this.types = types;
+        }
+
+        _add(name, unit) {
+            const i = this.names.length;
+            this._grow(i + 1);
+            this.names.push(name);
+            this.units.push(unit || '');
+            this.index.set(name, i);
+            this.statuses[i] = 0;
+
+            const type = metricType(name);
+            let typeId = this.typeIds.get(type);
+            if (typeId === undefined) {
+                typeId = this.typeNames.length;
+                this.typeNames.push(type);
+                this.typeIds.set(type, typeId);
+            }
+            this.types[i] = typeId;
+
+            const code = this.pendingStatuses.get(name);
+            if (code !== undefined) {
+                this.pendingStatuses.delete(name);
+                this._setStatus(i, code);
+            }
+            return i;
+        }
+
+        _setStatus(i, code) {
+            const previous = this.statuses[i];
+            if (previous === code) return;
+            if (previous === 1) this.warningCount--;
+            if (previous === 2) this.criticalCount--;
+            if (code === 1) this.warningCount++;
+            if (code === 2) this.criticalCount++;
+            this.statuses[i] = code;
+        }
+
+        /**
+         * Apply a metrics frame.
+         *
+         * Returns true if any new series appeared.
+         */
+        applyMetrics(metrics) {
+            let added = false;
+            for (const name in metrics) {
+                const data = metrics[name];
+                let i = this.index.get(name);
+                if (i === undefined) {
+                    i = this._add(name, data.unit);
+                    added = true;
+                }
+                this.values[i] = data.value;
+            }
+            return added;
+        }
+
+        /**
+         * Apply an alarm status map; entries may be status strings or the
+         * server's {status, value, ...} objects.
+         *
+         * A full map replaces every status; otherwise only the listed
+         * series change.
+         */
+        applyAlarms(status, full = true) {
+            if (full) {
+                this.pendingStatuses = new Map();
+                this.statuses.fill(0);
+                this.warningCount = 0;
+                this.criticalCount = 0;
+            }
+            for (const name in status) {
+                const entry = status[name];
+                const level = typeof entry === 'string' ? entry : entry && entry.status;
+                const code = STATUS_CODES[level] || 0;
+
+                const i = this.index.get(name);
+                if (i === undefined) {
+                    if (code !== 0) {
+                        this.pendingStatuses.set(name, code);
+                    } else {
+                        this.pendingStatuses.delete(name);
+                    }
+                } else {
+                    this._setStatus(i, code);
+                }
+            }
+        }
+
+        get(name) {
+            const i = this.index.get(name);
+            if (i === undefined) return null;
+            return {
+                value: this.values[i],
+                unit: this.units[i],
+                status: STATUS_LEVELS[this.statuses[i]]
+            };
+        }
+
+        highestSeverity() {
+            if (this.criticalCount > 0) return 'critical';
+            if (this.warningCount > 0) return 'warning';
+            return 'normal';
+        }
+
+        /**
+         * Aggregate every series by metric type.
+         *
+         * Returns {type: {mean, count, status, worst}} where `status` is the
+         * worst status of the type and `worst` the first series with it.
+         */
+        summarizeTypes() {
+            const typeCount = this.typeNames.length;
+            const sums = new Float64Array(typeCount);
+            const counts = new Uint32Array(typeCount);
+            const worstCodes = new Uint8Array(typeCount);
+            const worstIndex = new Int32Array(typeCount).fill(-1);
+
+            for (let i = 0; i < this.names.length; i++) {
+                const t = this.types[i];
+                const code = this.statuses[i];
+                sums[t] += this.values[i];
+                counts[t]++;
+                if (worstIndex[t] === -1 || code > worstCodes[t]) {
+                    worstCodes[t] = code;
+                    worstIndex[t] = i;
+                }
+            }
+
+            const summary = {};
+            for (let t = 0; t < typeCount; t++) {
+                if (counts[t] === 0) continue;
+                summary[this.typeNames[t]] = {
+                    mean: sums[t] / counts[t],
+                    count: counts[t],
+                    status: STATUS_LEVELS[worstCodes[t]],
+                    worst: this.names[worstIndex[t]]
+                };
+            }
+            return summary;
+        }
+
+        /**
+         * Up to `limit` non-normal series as {name, status}, critical first
+         */
+        activeAlarms(limit) {
+            const active = [];
+            for (const wanted of [2, 1]) {
+                for (let i = 0; i < this.names.length && active.length < limit; i++) {
+                    if (this.statuses[i] === wanted) {
+                        active.push({ name: this.names[i], status: STATUS_LEVELS[wanted] });
+                    }
+                }
+            }
+            return active;
+        }
+    }
+
+    /**
+     * Fixed-size ring buffer of numeric samples.
+     */
+    class HistoryRing {
+        constructor(capacity) {
+            this.samples = new Float64Array(capacity);
+            this.start = 0;
+            this.length = 0;
+        }
+
+        push(value) {
+            const capacity = this.samples.length;
+            if (this.length < capacity) {
+                this.samples[(this.start + this.length) % capacity] = value;
+                this.length++;
+            } else {
+                this.samples[this.start] = value;
+                this.start = (this.start + 1) % capacity;
+            }
+        }
+
+        /**
+         * Samples in chronological order
+         */
+        toArray() {
+            const capacity = this.samples.length;
+            const out = new Float64Array(this.length);
+            for (let i = 0; i < this.length; i++) {
+                out[i] = this.samples[(this.start + i) % capacity];
+            }
+            return out;
+        }
+    }
+
+    /**
+     * Rows of a fixed-height list that intersect the viewport, plus overscan.
+     *
+     * Returns {start, end} with `end` exclusive.
+     */
+    function visibleRange(scrollTop, viewportHeight, rowHeight, total, overscan = 5) {
+        const first = Math.floor(scrollTop / rowHeight);
+        const count = Math.ceil(viewportHeight / rowHeight);
+        return {
+            start: Math.max(0, first - overscan),
+            end: Math.min(total, first + count + overscan)
+        };
+    }
+
+    /**
+     * Min/max decimation of a sample array into `buckets` columns.
+     *
+     * Returns a Float64Array of [min0, max0, min1, max1, ...]. Drawing a
+     * vertical line per column keeps every spike visible however many
+     * samples fall into it.
+     */
+    function decimateMinMax(samples, buckets) {
+        const n = samples.length;
+        if (n === 0) return new Float64Array(0);
+        const columns = Math.max(1, Math.min(Math.floor(buckets), n));
+        const out = new Float64Array(columns * 2);
+        for (let c = 0; c < columns; c++) {
+            const from = Math.floor(c * n / columns);
+            const to = Math.max(from + 1, Math.floor((c + 1) * n / columns));
+            let min = Infinity;
+            let max = -Infinity;
+            for (let i = from; i < to && i < n; i++) {
+                const v = samples[i];
+                if (v < min) min = v;
+                if (v > max) max = v;
+            }
+            out[c * 2] = min;
+            out[c * 2 + 1] = max;
+        }
+        return out;
+    }
+
+    return {
+        STATUS_LEVELS,
+        FrameBuffer,
+        SeriesStore,
+        HistoryRing,
+        visibleRange,
+        decimateMinMax
+    };
+}));
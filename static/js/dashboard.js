@@ -67,6 +67,30 @@ const thresholdInputs = {
 const alarmStatus = document.getElementById('alarm-status');
 const alarmHistory = document.getElementById('alarm-history');
 
+// Series list and history chart elements
+const seriesViewport = document.getElementById('series-viewport');
+const seriesSpacer = document.getElementById('series-spacer');
+const seriesCount = document.getElementById('series-count');
+const historyChart = document.getElementById('history-chart');
+const historyMetricLabel = document.getElementById('history-metric');
+
+// Render batching state
+const { FrameBuffer, SeriesStore, HistoryRing, visibleRange, decimateMinMax } = DashboardState;
+const SERIES_ROW_HEIGHT = 28;      // px, must match .series-row in styles.css
+const HISTORY_CAPACITY = 3600;     // samples kept for the history chart
+const MAX_ACTIVE_ALARMS_SHOWN = 10;
+const METRIC_MAX = { cpu: 100, memory: 100, bandwidth: 1000, latency: 500 };
+let frameBuffer = new FrameBuffer();
+let seriesStore = new SeriesStore();
+const seriesRows = [];
+let renderScheduled = false;
+let seriesListDirty = true;
+let selectedMetric = 'cpu';
+let selectedHistory = new HistoryRing(HISTORY_CAPACITY);
+let currentThresholds = {};
+let lastHistoryKey = null;
+let typeSummary = {};
+
 /**
  * Connect to the WebSocket server
  */
@@ -95,6 +119,9 @@ socket.addEventListener('open', (event) => {
         reconnectInterval = null;
     }
     
+    // Drop series from any earlier server run; the server resends everything
+    resetSeriesState();
+    
     // Request current configuration
     socket.send(JSON.stringify({ action: 'get_thresholds' }));
 });
@@ -149,17 +176,19 @@ function sendMessage(type, data) {
  * Handle incoming messages from the server
  */
 function handleMessage(message) {
-    console.log("Received message:", message);
-    
-    // Handle metrics_update messages
+    // Metric and alarm frames are buffered and applied once per animation frame
     if (message.type === 'metrics_update') {
-        updateMetrics(message.data);
+        // History is recorded per frame so samples in frames that are
+        // superseded before the next render still reach the chart
+        recordHistory(message.data);
+        frameBuffer.pushMetrics(message.data, message.full);
+        scheduleRender();
         return;
     }
     
-    // Handle alarm_update messages
     if (message.type === 'alarm_update') {
-        updateAlarms(message.status, message.history);
+        frameBuffer.pushAlarm(message.status, message.history, message.full);
+        scheduleRender();
         return;
     }
     
@@ -188,12 +217,63 @@ function handleMessage(message) {
 }
 
 /**
- * Update metrics display
+ * Request a render on the next animation frame (at most one pending)
+ */
+function scheduleRender() {
+    if (renderScheduled) return;
+    renderScheduled = true;
+    requestAnimationFrame(renderFrame);
+}
+
+/**
+ * Apply everything buffered since the last frame and redraw
  */
-function updateMetrics(metrics) {
-    for (const [metric, data] of Object.entries(metrics)) {
-        const elements = metricElements[metric];
-        if (!elements) continue;
+function renderFrame() {
+    renderScheduled = false;
+    
+    if (!frameBuffer.isEmpty()) {
+        const pending = frameBuffer.drain();
+        
+        if (pending.metricFrames.length) {
+            for (const metrics of pending.metricFrames) {
+                seriesStore.applyMetrics(metrics);
+            }
+            ensureSelection();
+            seriesListDirty = true;
+        }
+        
+        if (pending.alarmFrames.length) {
+            for (const alarm of pending.alarmFrames) {
+                seriesStore.applyAlarms(alarm.status, alarm.full);
+            }
+            updateAlarms(pending.history);
+            seriesListDirty = true;
+        }
+        
+        updateCards();
+        drawHistoryChart();
+    }
+    
+    if (seriesListDirty) {
+        renderSeriesList();
+        seriesListDirty = false;
+    }
+}
+
+/**
+ * Update the metric cards from per-type aggregates of the series store.
+ *
+ * Each card shows the mean of its type's series and the worst status among
+ * them; with the built-in simulator each type is a single series.
+ */
+function updateCards() {
+    typeSummary = seriesStore.summarizeTypes();
+    
+    for (const [metric, elements] of Object.entries(metricElements)) {
+        const summary = typeSummary[metric];
+        if (!summary) continue;
+        
+        const value = summary.mean;
         
         // Format value based on metric type
         let displayValue;
@@ -202,23 +282,27 @@ function updateMetrics(metrics) {
         switch (metric) {
             case 'cpu':
             case 'memory':
-                displayValue = `${data.value.toFixed(1)}%`;
-                percentage = data.value;
+                displayValue = `${value.toFixed(1)}%`;
+                percentage = value;
                 break;
                 
             case 'bandwidth':
-                displayValue = `${data.value.toFixed(1)} Mbps`;
-                percentage = (data.value / 1000) * 100; // 1000 Mbps max
+                displayValue = `${value.toFixed(1)} Mbps`;
+                percentage = (value / 1000) * 100; // 1000 Mbps max
                 break;
                 
             case 'latency':
-                displayValue = `${data.value.toFixed(1)} ms`;
-                percentage = (data.value / 500) * 100; // 500 ms max
+                displayValue = `${value.toFixed(1)} ms`;
+                percentage = (value / 500) * 100; // 500 ms max
                 break;
                 
             default:
-                displayValue = data.value.toFixed(1);
-                percentage = data.value;
+                displayValue = value.toFixed(1);
+                percentage = value;
+        }
+        
+        if (summary.count > 1) {
+            displayValue += ` (mean of ${summary.count} series)`;
         }
         
         // Update displayed value and bar
@@ -229,52 +313,35 @@ function updateMetrics(metrics) {
         if (elements.bar) {
             elements.bar.style.width = `${percentage}%`;
         }
+        
+        if (elements.container) {
+            elements.container.classList.remove('normal', 'warning', 'critical');
+            elements.container.classList.add(summary.status);
+        }
     }
 }
 
 /**
- * Update alarm displays
+ * Update alarm displays from the series store
  */
-function updateAlarms(status, history) {
-    console.log("Updating alarms with:", status, history);
-    
-    // Update status classes on metric containers
-    for (const [metric, alarmStatus] of Object.entries(status || {})) {
-        const elements = metricElements[metric];
-        if (!elements || !elements.container) continue;
-        
-        console.log(`Setting ${metric} to ${alarmStatus}`);
-        
-        // Remove existing status classes
-        elements.container.classList.remove('normal', 'warning', 'critical');
-        
-        // Add current status class
-        elements.container.classList.add(alarmStatus);
-    }
-    
-    // Check highest severity alarm
-    let highestSeverity = 'normal';
-    let activeAlarms = [];
-    
-    for (const [metric, alarmStatus] of Object.entries(status || {})) {
-        if (alarmStatus !== 'normal') {
-            const metricName = metric.charAt(0).toUpperCase() + metric.slice(1);
-            activeAlarms.push(`${metricName}: ${alarmStatus.toUpperCase()}`);
-            
-            if (alarmStatus === 'critical') {
-                highestSeverity = 'critical';
-            } else if (alarmStatus === 'warning' && highestSeverity !== 'critical') {
-                highestSeverity = 'warning';
-            }
-        }
-    }
+function updateAlarms(history) {
+    const highestSeverity = seriesStore.highestSeverity();
     
     // Update alarm status display
     if (highestSeverity === 'normal') {
         alarmStatus.textContent = 'No Alarms';
         alarmStatus.className = 'no-alarm';
     } else {
-        alarmStatus.textContent = activeAlarms.join(', ');
+        const active = seriesStore.activeAlarms(MAX_ACTIVE_ALARMS_SHOWN).map(alarm => {
+            const metricName = alarm.name.charAt(0).toUpperCase() + alarm.name.slice(1);
+            return `${metricName}: ${alarm.status.toUpperCase()}`;
+        });
+        const total = seriesStore.warningCount + seriesStore.criticalCount;
+        if (total > active.length) {
+            active.push(`+${total - active.length} more`);
+        }
+        
+        alarmStatus.textContent = active.join(', ');
         alarmStatus.className = `${highestSeverity}-alarm`;
         
         // Play sound if enabled and critical alarm
@@ -285,76 +352,201 @@ function updateAlarms(status, history) {
         }
     }
     
-    // Update alarm history
-    if (alarmHistory && history) {
-        alarmHistory.innerHTML = '';
-        
-        if (history.length === 0) {
-            const emptyItem = document.createElement('div');
-            emptyItem.className = 'alarm-history-item';
-            emptyItem.textContent = 'No alarm history';
-            alarmHistory.appendChild(emptyItem);
-        } else {
-            history.forEach(entry => {
-                const historyItem = document.createElement('div');
-                historyItem.className = `alarm-history-item ${entry.status || 'normal'}`;
-                
-                const timestamp = document.createElement('span');
-                timestamp.className = 'timestamp';
-                timestamp.textContent = entry.timestamp || '';
-                
-                const message = document.createElement('div');
-                message.textContent = entry.message || '';
-                
-                historyItem.appendChild(timestamp);
-                historyItem.appendChild(message);
-                
-                alarmHistory.appendChild(historyItem);
-            });
-        }
+    // Rebuild the alarm history only when it has changed
+    const historyKey = history.length ? `${history.length}:${history[0].timestamp}:${history[0].metric}` : '0';
+    if (!alarmHistory || historyKey === lastHistoryKey) return;
+    lastHistoryKey = historyKey;
+    
+    const fragment = document.createDocumentFragment();
+    
+    if (history.length === 0) {
+        const emptyItem = document.createElement('div');
+        emptyItem.className = 'alarm-history-item';
+        emptyItem.textContent = 'No alarm history';
+        fragment.appendChild(emptyItem);
+    } else {
+        history.forEach(entry => {
+            const historyItem = document.createElement('div');
+            historyItem.className = `alarm-history-item ${entry.status || 'normal'}`;
+            
+            const timestamp = document.createElement('span');
+            timestamp.className = 'timestamp';
+            timestamp.textContent = entry.timestamp || '';
+            
+            const message = document.createElement('div');
+            message.textContent = entry.message || '';
+            
+            historyItem.appendChild(timestamp);
+            historyItem.appendChild(message);
+            
+            fragment.appendChild(historyItem);
+        });
     }
+    
+    alarmHistory.replaceChildren(fragment);
 }
 
 /**
- * Handle incoming messages from the server
+ * Render only the series rows inside the scrolled viewport
  */
-function handleMessage(message) {
-    console.log("Received message:", message);
-    
-    // Handle metrics_update messages
-    if (message.type === 'metrics_update') {
-        updateMetrics(message.data);
-        return;
-    }
-    
-    // Handle alarm_update messages
-    if (message.type === 'alarm_update') {
-        updateAlarms(message.status, message.history);
-        return;
+function renderSeriesList() {
+    if (!seriesViewport) return;
+    
+    const total = seriesStore.size;
+    seriesSpacer.style.height = `${total * SERIES_ROW_HEIGHT}px`;
+    seriesCount.textContent = `${total} series`;
+    
+    const { start, end } = visibleRange(
+        seriesViewport.scrollTop,
+        seriesViewport.clientHeight,
+        SERIES_ROW_HEIGHT,
+        total
+    );
+    
+    // Grow the row pool to cover the viewport; rows are reused across frames
+    while (seriesRows.length < end - start) {
+        const row = document.createElement('div');
+        row.className = 'series-row';
+        row.appendChild(document.createElement('span')).className = 'series-name';
+        row.appendChild(document.createElement('span')).className = 'series-value';
+        seriesSpacer.appendChild(row);
+        seriesRows.push(row);
     }
     
-    // Handle status responses
-    if (message.status) {
-        console.log(`Received status: ${message.status}`);
+    for (let r = 0; r < seriesRows.length; r++) {
+        const row = seriesRows[r];
+        const i = start + r;
         
-        if (message.status === 'simulation_started') {
-            startSimButton.disabled = true;
-            stopSimButton.disabled = false;
-        } else if (message.status === 'simulation_stopped') {
-            startSimButton.disabled = false;
-            stopSimButton.disabled = true;
+        if (i >= end) {
+            row.style.display = 'none';
+            continue;
         }
         
-        return;
+        const name = seriesStore.names[i];
+        const value = seriesStore.values[i];
+        const status = DashboardState.STATUS_LEVELS[seriesStore.statuses[i]];
+        
+        row.style.display = '';
+        row.style.transform = `translateY(${i * SERIES_ROW_HEIGHT}px)`;
+        row.dataset.name = name;
+        row.className = `series-row ${status}${name === selectedMetric ? ' selected' : ''}`;
+        row.firstChild.textContent = name;
+        row.lastChild.textContent = `${value.toFixed(1)} ${seriesStore.units[i]}`;
+    }
+}
+
+/**
+ * Append the selected metric's latest value to its history
+ */
+function recordHistory(metrics) {
+    const data = metrics[selectedMetric];
+    if (data) {
+        selectedHistory.push(data.value);
+    }
+}
+
+/**
+ * Chart the first series with data if the selected one has never reported
+ */
+function ensureSelection() {
+    if (seriesStore.size > 0 && !seriesStore.index.has(selectedMetric)) {
+        selectMetric(seriesStore.names[0]);
+    }
+}
+
+/**
+ * Forget all series, history and pending frames
+ */
+function resetSeriesState() {
+    frameBuffer = new FrameBuffer();
+    seriesStore = new SeriesStore();
+    selectedHistory = new HistoryRing(HISTORY_CAPACITY);
+    lastHistoryKey = null;
+    typeSummary = {};
+    seriesListDirty = true;
+    drawHistoryChart();
+    scheduleRender();
+}
+
+/**
+ * Switch the history chart to another metric
+ */
+function selectMetric(name) {
+    if (!name || name === selectedMetric) return;
+    
+    selectedMetric = name;
+    selectedHistory = new HistoryRing(HISTORY_CAPACITY);
+    const current = seriesStore.get(name);
+    if (current) {
+        selectedHistory.push(current.value);
+    }
+    historyMetricLabel.textContent = name;
+    seriesListDirty = true;
+    drawHistoryChart();
+    scheduleRender();
+}
+
+/**
+ * Draw the selected metric's history on the canvas, one min/max column per pixel
+ */
+function drawHistoryChart() {
+    if (!historyChart) return;
+    
+    const ratio = window.devicePixelRatio || 1;
+    const width = historyChart.clientWidth;
+    const height = historyChart.clientHeight;
+    if (historyChart.width !== width * ratio || historyChart.height !== height * ratio) {
+        historyChart.width = width * ratio;
+        historyChart.height = height * ratio;
     }
     
-    // Handle thresholds
-    if (message.thresholds) {
-        updateConfig({ thresholds: message.thresholds });
-        return;
+    const ctx = historyChart.getContext('2d');
+    ctx.setTransform(ratio, 0, 0, ratio, 0, 0);
+    ctx.clearRect(0, 0, width, height);
+    
+    const samples = selectedHistory.toArray();
+    if (samples.length === 0) return;
+    
+    // Scale to the metric type's range, widened to fit the data if needed
+    const metricType = selectedMetric.split('-')[0];
+    const thresholds = currentThresholds[metricType];
+    let max = METRIC_MAX[metricType] || 0;
+    for (let i = 0; i < samples.length; i++) {
+        if (samples[i] > max) max = samples[i];
+    }
+    max = max || 1;
+    const y = value => height - (value / max) * height;
+    
+    // Threshold lines
+    if (thresholds) {
+        ctx.lineWidth = 1;
+        for (const [level, color] of [['warning', '#f39c12'], ['critical', '#e74c3c']]) {
+            ctx.strokeStyle = color;
+            ctx.beginPath();
+            ctx.moveTo(0, y(thresholds[level]) + 0.5);
+            ctx.lineTo(width, y(thresholds[level]) + 0.5);
+            ctx.stroke();
+        }
     }
     
-    console.warn('Unknown message format:', message);
+    // Samples fill the chart until there are more samples than pixels
+    const columns = decimateMinMax(samples, width);
+    const count = columns.length / 2;
+    const step = count > 1 ? width / (count - 1) : 0;
+    
+    ctx.strokeStyle = '#3498db';
+    ctx.lineWidth = 1.5;
+    ctx.beginPath();
+    for (let c = 0; c < count; c++) {
+        const x = c * step;
+        if (c === 0) {
+            ctx.moveTo(x, y(columns[0]));
+        } else {
+            ctx.lineTo(x, y(columns[c * 2]));
+        }
+        ctx.lineTo(x, y(columns[c * 2 + 1]));
+    }
+    ctx.stroke();
 }
 
 /**
@@ -362,6 +554,8 @@ function handleMessage(message) {
  */
 function updateConfig(data) {
     const thresholds = data.thresholds || {};
+    currentThresholds = { ...currentThresholds, ...thresholds };
+    drawHistoryChart();
     
     // Update threshold inputs
     for (const [metric, values] of Object.entries(thresholds)) {
@@ -484,6 +678,33 @@ clearAlarmsButton.addEventListener('click', () => {
         sendMessage('get_config', {});
     });
     
+    // Series list scrolling and selection
+    seriesViewport.addEventListener('scroll', () => {
+        seriesListDirty = true;
+        scheduleRender();
+    });
+    
+    seriesViewport.addEventListener('click', (event) => {
+        const row = event.target.closest('.series-row');
+        if (row) {
+            selectMetric(row.dataset.name);
+        }
+    });
+    
+    for (const [metric, elements] of Object.entries(metricElements)) {
+        // Chart the type's worst series (the metric itself in classic mode)
+        elements.container.addEventListener('click', () => {
+            const summary = typeSummary[metric];
+            selectMetric(summary ? summary.worst : metric);
+        });
+    }
+    
+    window.addEventListener('resize', () => {
+        seriesListDirty = true;
+        drawHistoryChart();
+        scheduleRender();
+    });
+    
     // Disable stop button initially
     stopSimButton.disabled = true;
 }
@@ -0,0 +1,117 @@
+"""
+Tests for the vectorized load generator.
+"""
+import json
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from threshold_alarm.alarm import AlarmManager
+from threshold_alarm.loadgen import LoadGeneratorFactory
+from threshold_alarm.threshold import ThresholdManager
+
+
+def make_factory(series_count=8, **kwargs):
+    threshold_manager = ThresholdManager()
+    alarm_manager = AlarmManager(threshold_manager)
+    return LoadGeneratorFactory(threshold_manager, alarm_manager, series_count, **kwargs)
+
+
+def record_alarm_updates(factory, monkeypatch):
+    """Capture the batches check_thresholds hands to the alarm manager."""
+    batches = []
+    original = factory.alarm_manager.update_alarms
+
+    def update_alarms(updates):
+        updates = list(updates)
+        batches.append(updates)
+        return original(updates)
+
+    monkeypatch.setattr(factory.alarm_manager, "update_alarms", update_alarms)
+    return batches
+
+
+def test_same_seed_gives_identical_values():
+    first = make_factory(1000, seed=7, spike_probability=0.05, flap_probability=0.05)
+    second = make_factory(1000, seed=7, spike_probability=0.05, flap_probability=0.05)
+
+    for _ in range(20):
+        first.simulate_metrics()
+        second.simulate_metrics()
+
+    np.testing.assert_array_equal(first.values, second.values)
+    np.testing.assert_array_equal(first.status, second.status)
+
+
+def test_check_thresholds_forwards_only_status_changes(monkeypatch):
+    factory = make_factory()
+    batches = record_alarm_updates(factory, monkeypatch)
+    warning, critical = factory.get_limits()
+
+    values = np.zeros(len(factory.names))
+    values[0] = 95  # cpu-000000 above the cpu critical threshold
+    factory.check_thresholds(values, warning, critical)
+    factory.check_thresholds(values, warning, critical)
+    values[0] = 0
+    factory.check_thresholds(values, warning, critical)
+
+    assert [[(name, status) for name, _, status, _ in batch] for batch in batches] == [
+        [("cpu-000000", "critical")],
+        [],
+        [("cpu-000000", "normal")],
+    ]
+
+
+def test_clear_alarms_resets_status(monkeypatch):
+    factory = make_factory()
+    warning, critical = factory.get_limits()
+    values = np.zeros(len(factory.names))
+    values[0] = 95
+    factory.check_thresholds(values, warning, critical)
+    assert factory.status[0] == 2
+
+    factory.alarm_manager.clear_alarms()
+    assert not factory.status.any()
+
+    # The series is still critical, so the next check raises it again
+    batches = record_alarm_updates(factory, monkeypatch)
+    factory.check_thresholds(values, warning, critical)
+    assert [name for name, _, _, _ in batches[0]] == ["cpu-000000"]
+    assert factory.alarm_manager.get_alarm_status("cpu-000000")["status"] == "critical"
+
+
+def test_baseline_ignores_runtime_threshold_changes():
+    factory = make_factory(seed=3)
+    before = factory.baseline()
+
+    factory.threshold_manager.update_threshold("cpu", 10, 20)
+
+    np.testing.assert_array_equal(factory.baseline(), before)
+
+
+def test_encode_snapshot_matches_get_all_metrics():
+    factory = make_factory(seed=5)
+    factory.simulate_metrics()
+
+    frame = json.loads(factory.encode_snapshot())
+
+    assert frame["type"] == "metrics_update"
+    assert frame["full"] is True
+    expected = factory.get_all_metrics()
+    assert frame["data"].keys() == expected.keys()
+    for name, data in expected.items():
+        assert frame["data"][name]["unit"] == data["unit"]
+        assert frame["data"][name]["value"] == pytest.approx(data["value"], abs=1e-3)
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"series_count": 0},
+    {"rate": 0},
+    {"rate": -1},
+    {"diurnal_period": 0},
+])
+def test_constructor_rejects_invalid_arguments(kwargs):
+    kwargs = {"series_count": 8, **kwargs}
+    with pytest.raises(ValueError):
+        make_factory(**kwargs)
@@ -4,7 +4,7 @@ Alarm module for managing and triggering alarms based on threshold crossings.
 from datetime import datetime
 from twisted.python import log
 from threshold_alarm.config import MAX_ALARM_HISTORY
-from threshold_alarm.protocol import MetricsProtocol
+from threshold_alarm.protocol import MetricsProtocol, encode_alarm_update
 
 class AlarmManager:
     """
@@ -15,6 +15,7 @@ class AlarmManager:
         self.alarms = {}
         self.alarm_history = []
         self.subscribers = set()
+        self.clear_listeners = []
 
         # Initialize alarm state for all metrics
         for metric in threshold_manager.thresholds.keys():
@@ -37,6 +38,39 @@ class AlarmManager:
             status (str): 'normal', 'warning', or 'critical'
             unit (str, optional): Unit of measurement
         """
+        if self._apply_alarm(metric, value, status, unit):
+            self.notify_subscribers([metric])
+
+    def update_alarms(self, updates):
+        """
+        Update alarm status for a batch of metrics.
+
+        Subscribers are notified once for the whole batch, with only the
+        changed metrics, and a single summary line is logged.
+
+        Args:
+            updates (iterable): (metric, value, status, unit) tuples
+
+        Returns:
+            int: Number of metrics whose status changed
+        """
+        changed = [
+            metric for metric, value, status, unit in updates
+            if self._apply_alarm(metric, value, status, unit, verbose=False)
+        ]
+
+        if changed:
+            log.msg(f"Alarm status changed for {len(changed)} metrics")
+            self.notify_subscribers(changed)
+        return len(changed)
+
+    def _apply_alarm(self, metric, value, status, unit=None, verbose=True):
+        """
+        Record a status for a metric without notifying subscribers.
+
+        Returns:
+            bool: True if the status changed
+        """
         if metric not in self.alarms:
             self.alarms[metric] = {
                 "status": "normal",
@@ -49,36 +83,39 @@ class AlarmManager:
             unit = self.alarms[metric].get("unit", "")
 
         old_status = self.alarms[metric]["status"]
-        if old_status != status:
-            now_str = datetime.now().isoformat()
+        if old_status == status:
+            return False
 
-            # Update alarm
-            self.alarms[metric].update({
-                "status": status,
-                "value": value,
-                "unit": unit
-            })
+        now_str = datetime.now().isoformat()
+
+        # Update alarm
+        self.alarms[metric].update({
+            "status": status,
+            "value": value,
+            "unit": unit
+        })
 
-            if status != "normal":
-                self.alarms[metric]["last_triggered"] = now_str
+        if status != "normal":
+            self.alarms[metric]["last_triggered"] = now_str
 
-                history_entry = {
-                    "metric": metric,
-                    "status": status,
-                    "value": value,
-                    "unit": unit,
-                    "timestamp": now_str,
-                    "message": f"{metric.upper()} {status}: {value}{unit}"
-                }
+            history_entry = {
+                "metric": metric,
+                "status": status,
+                "value": value,
+                "unit": unit,
+                "timestamp": now_str,
+                "message": f"{metric.upper()} {status}: {value}{unit}"
+            }
 
-                self.alarm_history.insert(0, history_entry)
-                self.alarm_history = self.alarm_history[:MAX_ALARM_HISTORY]
+            self.alarm_history.insert(0, history_entry)
+            self.alarm_history = self.alarm_history[:MAX_ALARM_HISTORY]
 
+            if verbose:
                 log.msg(f"Alarm triggered: {history_entry['message']}")
-            else:
-                log.msg(f"Alarm cleared for {metric}")
+        elif verbose:
+            log.msg(f"Alarm cleared for {metric}")
 
-            self.notify_subscribers()
+        return True
 
     def get_alarm_status(self, metric=None):
         """
@@ -120,9 +157,15 @@ class AlarmManager:
             self.alarms[metric]["last_triggered"] = None
 
         log.msg("All alarms cleared")
+        for listener in self.clear_listeners:
+            listener()
         self.notify_subscribers()
         return True
 
+    def add_clear_listener(self, listener):
+        """Register a callable to be invoked when all alarms are cleared."""
+        self.clear_listeners.append(listener)
+
     def add_subscriber(self, subscriber: MetricsProtocol):
         """Add a subscriber for alarm updates."""
         self.subscribers.add(subscriber)
@@ -136,9 +179,24 @@ class AlarmManager:
         """Unregisters a subscriber."""
         self.subscribers.discard(subscriber)
 
-    def notify_subscribers(self):
-        """Notify all subscribers of alarm updates."""
-        for subscriber in self.subscribers:
-            if hasattr(subscriber, 'send_alarm_update'):
-                subscriber.send_alarm_update(self.get_alarm_status(), self.alarm_history)
+    def notify_subscribers(self, changed=None):
+        """
+        Notify all subscribers of alarm updates.
+
+        Args:
+            changed (list, optional): Metrics whose status changed; when
+                omitted the status of every metric is sent
+        """
+        if not self.subscribers:
+            return
+
+        if changed is None:
+            payload = encode_alarm_update(self.alarms, self.alarm_history)
+        else:
+            status = {metric: self.alarms[metric] for metric in changed}
+            payload = encode_alarm_update(status, self.alarm_history, full=False)
+
+        for subscriber in list(self.subscribers):
+            if hasattr(subscriber, 'send_payload'):
+                subscriber.send_payload(payload)
 
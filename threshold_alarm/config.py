@@ -55,5 +55,14 @@ METRIC_SPECS = {
     }
 }
 
+# Synthetic load generator settings (see threshold_alarm.loadgen)
+LOADGEN_RATE = 1.0                  # ticks per second
+LOADGEN_SPIKE_PROBABILITY = 0.001   # per series, per tick
+LOADGEN_FLAP_PROBABILITY = 0.0005   # per series, per tick
+LOADGEN_DIURNAL_PERIOD = 86400.0    # seconds of simulated time
+LOADGEN_BASELINE_FRACTION = 0.6     # diurnal midpoint, as a fraction of min..warning
+LOADGEN_DIURNAL_AMPLITUDE = 0.2     # swing around the midpoint, same scale
+LOADGEN_MEAN_REVERSION = 0.2        # pull of the random walk back to the diurnal baseline
+
 # Alarm settings
 MAX_ALARM_HISTORY = 50
\ No newline at end of file
@@ -0,0 +1,272 @@
+"""
+Vectorized synthetic load generator for capacity-testing the alarm pipeline.
+
+Unlike MetricsFactory, which steps each metric in a Python loop, this module
+generates a whole tick for every series at once with NumPy and feeds the
+results into the threshold and alarm managers as a single batch.
+"""
+import json
+import math
+
+import numpy as np
+from twisted.python import log
+
+from threshold_alarm.config import (
+    DEFAULT_THRESHOLDS,
+    METRIC_SPECS,
+    LOADGEN_RATE,
+    LOADGEN_SPIKE_PROBABILITY,
+    LOADGEN_FLAP_PROBABILITY,
+    LOADGEN_DIURNAL_PERIOD,
+    LOADGEN_BASELINE_FRACTION,
+    LOADGEN_DIURNAL_AMPLITUDE,
+    LOADGEN_MEAN_REVERSION,
+)
+from threshold_alarm.metrics import MetricsFactory
+
+# Alarm status for each integer status code used by the generator
+STATUS_LEVELS = ("normal", "warning", "critical")
+
+# Decimal places kept when encoding values for subscribers
+VALUE_DECIMALS = 3
+
+
+class LoadGeneratorFactory(MetricsFactory):
+    """
+    MetricsFactory that simulates many series per metric type in batches.
+
+    Series are named "<metric>-<index>" (e.g. "cpu-000042") and are laid out
+    in one contiguous block per metric type, so threshold checks against the
+    per-type thresholds run on array slices.
+    """
+    def __init__(self, threshold_manager, alarm_manager, series_count,
+                 rate=LOADGEN_RATE, seed=None,
+                 spike_probability=LOADGEN_SPIKE_PROBABILITY,
+                 flap_probability=LOADGEN_FLAP_PROBABILITY,
+                 diurnal_period=LOADGEN_DIURNAL_PERIOD,
+                 diurnal_amplitude=LOADGEN_DIURNAL_AMPLITUDE):
+        if series_count < 1:
+            raise ValueError("series_count must be at least 1")
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if diurnal_period <= 0:
+            raise ValueError("diurnal_period must be positive")
+
+        super().__init__(threshold_manager, alarm_manager)
+        self.simulation_interval = 1.0 / rate
+
+        # Series state lives in the arrays below; the per-metric dicts built
+        # by MetricsFactory are not used
+        self.metrics = {}
+
+        self.seed = seed
+        self.spike_probability = spike_probability
+        self.flap_probability = flap_probability
+        self.diurnal_period = diurnal_period
+        self.diurnal_amplitude = diurnal_amplitude
+        self.rng = np.random.default_rng(seed)
+        self.tick = 0
+
+        # Split the series evenly across the metric types
+        metric_types = list(METRIC_SPECS)
+        per_type, extra = divmod(series_count, len(metric_types))
+        self.blocks = []
+        self.names = []
+        self.units = []
+        start = 0
+        for position, metric_type in enumerate(metric_types):
+            count = per_type + (1 if position < extra else 0)
+            self.blocks.append((metric_type, slice(start, start + count)))
+            self.names.extend(f"{metric_type}-{i:06d}" for i in range(count))
+            self.units.extend([METRIC_SPECS[metric_type]["unit"]] * count)
+            start += count
+        self.index = {name: i for i, name in enumerate(self.names)}
+
+        counts = [block.stop - block.start for _, block in self.blocks]
+        specs = [METRIC_SPECS[metric_type] for metric_type in metric_types]
+        self.lower = np.repeat([spec["min"] for spec in specs], counts).astype(float)
+        self.upper = np.repeat([spec["max"] for spec in specs], counts).astype(float)
+        self.volatility = np.repeat([spec["volatility"] for spec in specs], counts).astype(float)
+
+        # The baseline sits below the default warning threshold. It is fixed
+        # here so tuning a threshold at runtime does not move the signal.
+        defaults = [DEFAULT_THRESHOLDS.get(metric_type, {}).get("warning", spec["max"])
+                    for metric_type, spec in zip(metric_types, specs)]
+        self.ceiling = np.minimum(np.repeat(defaults, counts).astype(float), self.upper)
+
+        # Snapshot frames are assembled from per-series JSON fragments
+        self.json_prefixes = [f'{json.dumps(name)}:{{"value":' for name in self.names]
+        self.json_suffixes = [f',"unit":{json.dumps(unit)}}}' for unit in self.units]
+
+        # Each series gets its own position in the daily cycle
+        self.phase = self.rng.random(series_count)
+        self.offset = np.zeros(series_count)
+        self.values = self.baseline()
+        self.status = np.zeros(series_count, dtype=np.int8)
+
+        # Alarms cleared through the alarm manager are raised again on the
+        # next tick that still exceeds a threshold
+        alarm_manager.add_clear_listener(self.reset_status)
+
+        log.msg(f"Load generator initialized: {series_count} series, "
+                f"{rate} ticks/s, seed={seed}")
+
+    def baseline(self):
+        """
+        Diurnal baseline value of every series at the current tick.
+
+        The baseline is placed between each series' minimum and its default
+        warning threshold, so series start normal and alarms come from the
+        random walk, spikes and flaps.
+        """
+        elapsed = self.tick * self.simulation_interval
+        angle = 2 * math.pi * (elapsed / self.diurnal_period + self.phase)
+        fraction = LOADGEN_BASELINE_FRACTION + self.diurnal_amplitude * np.sin(angle)
+        return self.lower + (self.ceiling - self.lower) * fraction
+
+    def get_limits(self):
+        """
+        Expand the per-type thresholds to one entry per series.
+
+        Metric types without thresholds get limits above their range so they
+        never alarm.
+
+        Returns:
+            tuple: (warning, critical) arrays
+        """
+        warning = np.empty(len(self.names))
+        critical = np.empty(len(self.names))
+        for metric_type, block in self.blocks:
+            limits = self.threshold_manager.get_threshold(metric_type)
+            if limits:
+                warning[block] = limits["warning"]
+                critical[block] = limits["critical"]
+            else:
+                warning[block] = np.inf
+                critical[block] = np.inf
+        return warning, critical
+
+    def generate_tick(self, warning, critical):
+        """
+        Advance every series by one tick.
+
+        Each series follows a mean-reverting random walk around its diurnal
+        baseline. Spikes jump to 70-95% of the range for one tick, and flaps
+        force a series across its thresholds in the opposite direction to its
+        current status.
+
+        Returns:
+            ndarray: New value of every series
+        """
+        count = len(self.names)
+        span = self.upper - self.lower
+
+        self.offset *= 1 - LOADGEN_MEAN_REVERSION
+        self.offset += self.rng.standard_normal(count) * self.volatility
+        values = self.baseline() + self.offset
+
+        spikes = self.rng.random(count) < self.spike_probability
+        spike_count = int(spikes.sum())
+        if spike_count:
+            values[spikes] = (self.lower[spikes]
+                              + span[spikes] * self.rng.uniform(0.7, 0.95, spike_count))
+
+        flaps = self.rng.random(count) < self.flap_probability
+        if flaps.any():
+            raised = np.minimum(critical[flaps], self.upper[flaps])
+            lowered = self.lower[flaps] + (np.minimum(warning[flaps], self.upper[flaps])
+                                           - self.lower[flaps]) / 2
+            values[flaps] = np.where(self.status[flaps] == 0, raised, lowered)
+
+        return np.clip(values, self.lower, self.upper)
+
+    def simulate_metrics(self):
+        """Generate one tick for all series and push it through the pipeline."""
+        warning, critical = self.get_limits()
+        self.values = self.generate_tick(warning, critical)
+        self.check_thresholds(self.values, warning, critical)
+        self.tick += 1
+
+        log.msg(f"Load generator tick {self.tick}: {len(self.names)} series, "
+                f"{int(np.count_nonzero(self.status))} alarming")
+
+        if self.subscribers:
+            self.broadcast(self.encode_snapshot())
+
+    def check_thresholds(self, values, warning, critical):
+        """Check a batch of values and forward status changes to the alarm manager."""
+        status = (values >= warning).astype(np.int8) + (values >= critical)
+        changed = np.flatnonzero(status != self.status)
+        self.status = status
+
+        self.alarm_manager.update_alarms(
+            (self.names[i], value, STATUS_LEVELS[code], self.units[i])
+            for i, value, code in zip(changed.tolist(),
+                                      values[changed].tolist(),
+                                      status[changed].tolist())
+        )
+
+    def reset_status(self):
+        """Forget the last known statuses after the alarm manager clears them."""
+        self.status[:] = 0
+
+    def get_metric(self, metric_name):
+        """Get the current value of a specific series."""
+        i = self.index.get(metric_name)
+        if i is None:
+            return None
+        return {
+            "value": float(self.values[i]),
+            "unit": self.units[i]
+        }
+
+    def get_all_metrics(self):
+        """Get all current series values."""
+        return {
+            name: {
+                "value": value,
+                "unit": unit
+            } for name, value, unit in zip(self.names, self.values.tolist(), self.units)
+        }
+
+    def encode_snapshot(self):
+        """
+        Encode a full metrics_update frame straight from the value array.
+
+        Produces the same JSON as encode_metrics_update(get_all_metrics(),
+        full=True) with values rounded to VALUE_DECIMALS, without building
+        an intermediate dict per series.
+        """
+        values = map(repr, np.round(self.values, VALUE_DECIMALS).tolist())
+        entries = ",".join(map("".join, zip(self.json_prefixes, values, self.json_suffixes)))
+        return f'{{"type":"metrics_update","full":true,"data":{{{entries}}}}}'.encode("utf8")
+
+    def simulate_spike(self, metric_name, percentage=0.9):
+        """
+        Simulate a spike in a single series.
+
+        A bare metric type (e.g. "cpu") spikes the first series of that type.
+        """
+        if metric_name in METRIC_SPECS:
+            metric_name = f"{metric_name}-{0:06d}"
+        i = self.index.get(metric_name)
+        if i is None:
+            return False
+
+        spike_value = float(self.upper[i] * percentage)
+        self.values[i] = spike_value
+
+        metric_type = metric_name.rsplit("-", 1)[0]
+        status = self.threshold_manager.check_threshold(metric_type, spike_value)
+        self.status[i] = STATUS_LEVELS.index(status)
+        self.alarm_manager.update_alarm(metric_name, spike_value, status, self.units[i])
+
+        update = {
+            metric_name: {
+                "value": spike_value,
+                "unit": self.units[i]
+            }
+        }
+        self.notify_subscribers(update)
+
+        return True
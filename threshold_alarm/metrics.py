@@ -7,6 +7,7 @@ from twisted.internet import reactor
 from twisted.python import log
 
 from threshold_alarm.config import SIMULATION_INTERVAL, METRIC_SPECS
+from threshold_alarm.protocol import encode_metrics_update
 
 class MetricsFactory:
     """
@@ -18,6 +19,7 @@ class MetricsFactory:
         self.metrics = {}
         self.subscribers = set()
         self.simulation_loop = None
+        self.simulation_interval = SIMULATION_INTERVAL
         self.is_simulating = False
         
         # Initialize metrics with default values
@@ -38,7 +40,7 @@ class MetricsFactory:
         
         self.is_simulating = True
         self.simulation_loop = task.LoopingCall(self.simulate_metrics)
-        self.simulation_loop.start(SIMULATION_INTERVAL)
+        self.simulation_loop.start(self.simulation_interval)
         log.msg("Metric simulation started")
     
     def stop_simulation(self):
@@ -81,10 +83,11 @@ class MetricsFactory:
             }
         
         # For debugging - log some values
-        log.msg(f"Simulated metrics: {', '.join([f'{k}={v['value']:.1f}{v['unit']}' for k,v in updates.items()])}")
+        summary = ', '.join(f"{k}={v['value']:.1f}{v['unit']}" for k, v in updates.items())
+        log.msg(f"Simulated metrics: {summary}")
         
         # Notify subscribers
-        self.notify_subscribers(updates)
+        self.notify_subscribers(updates, full=True)
     
     def check_threshold(self, metric_name, value):
         """Check if a metric has crossed any thresholds."""
@@ -109,22 +112,37 @@ class MetricsFactory:
             } for name, data in self.metrics.items()
         }
     
+    def encode_snapshot(self):
+        """Encode a full metrics_update frame with every current value."""
+        return encode_metrics_update(self.get_all_metrics(), full=True)
+
     def add_subscriber(self, subscriber):
         """Add a new subscriber for metric updates."""
         self.subscribers.add(subscriber)
         # Send current values immediately to new subscriber
-        subscriber.send_metrics(self.get_all_metrics())
+        subscriber.send_payload(self.encode_snapshot())
     
     def remove_subscriber(self, subscriber):
         """Remove a subscriber."""
         if subscriber in self.subscribers:
             self.subscribers.remove(subscriber)
     
-    def notify_subscribers(self, metrics_update):
-        """Send metric updates to all subscribers."""
+    def notify_subscribers(self, metrics_update, full=False):
+        """
+        Send metric updates to all subscribers.
+
+        Args:
+            metrics_update (dict): Values keyed by metric name
+            full (bool): True if the update covers every metric
+        """
+        if self.subscribers:
+            self.broadcast(encode_metrics_update(metrics_update, full))
+
+    def broadcast(self, payload):
+        """Send one encoded frame to every subscriber."""
         for subscriber in list(self.subscribers):
             try:
-                subscriber.send_metrics(metrics_update)
+                subscriber.send_payload(payload)
             except Exception as e:
                 log.err(f"Error sending metrics to subscriber: {e}")
                 self.remove_subscriber(subscriber)
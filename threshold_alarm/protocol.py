@@ -5,6 +5,38 @@ from autobahn.twisted.websocket import WebSocketServerProtocol
 from twisted.python import log
 import json
 
+
+def encode_metrics_update(metrics, full=False):
+    """
+    Encode a metrics_update frame as UTF-8 JSON.
+
+    `full` marks a snapshot of every metric, which lets the client drop
+    any older frames it has not rendered yet.
+    """
+    data = {
+        'type': 'metrics_update',
+        'full': full,
+        'data': metrics
+    }
+    return json.dumps(data).encode('utf8')
+
+
+def encode_alarm_update(status, history, full=True):
+    """
+    Encode an alarm_update frame as UTF-8 JSON.
+
+    A full frame carries the status of every known metric; otherwise
+    `status` only holds the metrics whose status changed.
+    """
+    data = {
+        'type': 'alarm_update',
+        'full': full,
+        'status': status,
+        'history': history
+    }
+    return json.dumps(data).encode('utf8')
+
+
 class MetricsProtocol(WebSocketServerProtocol):
     """
     WebSocket protocol for handling metrics and alarm communication.
@@ -83,26 +115,23 @@ class MetricsProtocol(WebSocketServerProtocol):
         except Exception as e:
             log.err(f"Error processing message: {e}")
     
-    def send_metrics(self, metrics):
+    def send_metrics(self, metrics, full=False):
         """Send metrics data to the connected client."""
         try:
-            data = {
-                'type': 'metrics_update',
-                'data': metrics
-            }
-            metrics_json = json.dumps(data)
-            self.sendMessage(metrics_json.encode('utf8'))
+            self.sendMessage(encode_metrics_update(metrics, full))
         except Exception as e:
             print(f"Error sending metrics: {e}")
-    def send_alarm_update(self, status, history):
+
+    def send_alarm_update(self, status, history, full=True):
         """Send alarm status and history updates to the connected client."""
         try:
-            data = {
-                'type': 'alarm_update',
-                'status': status,
-                'history': history
-            }
-            alarm_json = json.dumps(data)
-            self.sendMessage(alarm_json.encode('utf8'))
+            self.sendMessage(encode_alarm_update(status, history, full))
         except Exception as e:
             print(f"Error sending alarm update: {e}")
+
+    def send_payload(self, payload):
+        """Send an already encoded frame, shared between subscribers."""
+        try:
+            self.sendMessage(payload)
+        except Exception as e:
+            print(f"Error sending payload: {e}")